@@ -11,7 +11,7 @@ Desenvolvido com as bibliotecas:
 - Streamlit para interface web
 - Pandas para manipulação de dados
 - Matplotlib/Seaborn para visualizações
-- FPDF para geração de relatórios PDF
+- ReportLab para geração de relatórios PDF
 
 Autor: Letícia Stahl
 Versão: 1.0
@@ -20,18 +20,13 @@ Data: 30/03/2025
 
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from fpdf import FPDF
-import base64
-from tempfile import NamedTemporaryFile
+import io
 import os
-import matplotlib
-import traceback
-
-matplotlib.use('Agg')
+import threading
+import logging
 
 st.set_page_config(
     page_title="Report Lab",
@@ -40,272 +35,558 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-plt.style.use('default')
-sns.set_theme(style="whitegrid")
-sns.set_palette(["#1a3a8f", "#1e4ed8", "#2563eb", "#3b82f6", "#93c5fd"])
+HIST_SAMPLE_SIZE = 50_000
+BOXPLOT_SAMPLE_SIZE = 200_000
+COLUMNWISE_NULL_SCAN_CELLS = 100_000_000
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+CSV_BLOCK_SIZE = 8 << 20
+CSV_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+PNG_COMPRESS_LEVEL = 3
+LOGO_MAX_PX = 300
+PERSIST_DATA_CACHE = os.environ.get('REPORT_LAB_PERSIST_CACHE') == '1'
 
-def cleanup_temp_files(*file_paths):
-    for path in file_paths:
-        if path and os.path.exists(path):
-            try:
-                os.unlink(path)
-            except Exception:
-                pass
+_thread_figures = threading.local()
 
-@st.cache_data
+HOMEPAGE_CSS = """
+<style>
+    .stApp { background-color: #f8fafc; }
+    .hero-section {
+        background: linear-gradient(135deg, #1a3a8f 0%, #2563eb 100%);
+        border-radius: 16px;
+        padding: 4rem 2rem;
+        margin: -1rem -1rem 3rem -1rem;
+        text-align: center;
+        color: white;
+        box-shadow: 0 4px 20px rgba(0, 0, 0, 0.1);
+    }
+    .title-text {
+        font-size: 3.5rem !important;
+        font-weight: 800 !important;
+        color: white !important;
+        margin-bottom: 1rem;
+        text-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+    }
+    .subtitle-text {
+        font-size: 1.5rem !important;
+        color: rgba(255, 255, 255, 0.9) !important;
+        margin-bottom: 2rem;
+        font-weight: 400;
+    }
+    .feature-card {
+        border-radius: 12px;
+        padding: 2rem 1.5rem;
+        background-color: white;
+        box-shadow: 0 4px 20px rgba(0, 0, 0, 0.05);
+        transition: all 0.3s ease;
+        height: 100%;
+        border: 1px solid #e2e8f0;
+    }
+    .feature-card:hover {
+        transform: translateY(-5px);
+        box-shadow: 0 10px 25px rgba(0, 0, 0, 0.1);
+        border-color: #93c5fd;
+    }
+    .feature-icon {
+        font-size: 2.5rem;
+        margin-bottom: 1.5rem;
+        color: #1a3a8f;
+        background: #e0f2fe;
+        width: 70px;
+        height: 70px;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        border-radius: 50%;
+        margin-left: auto;
+        margin-right: auto;
+    }
+    .feature-title {
+        font-size: 1.3rem;
+        font-weight: 700;
+        margin-bottom: 1rem;
+        color: #1e293b;
+        text-align: center;
+    }
+    .feature-desc {
+        color: #64748b;
+        font-size: 1rem;
+        text-align: center;
+        line-height: 1.6;
+    }
+    .how-to-container {
+        background-color: white;
+        border-radius: 16px;
+        padding: 3rem;
+        margin-top: 3rem;
+        box-shadow: 0 4px 20px rgba(0, 0, 0, 0.05);
+        border: 1px solid #e2e8f0;
+    }
+    .how-to-title {
+        font-size: 2rem;
+        font-weight: 700;
+        color: #1e293b;
+        text-align: center;
+        margin-bottom: 2rem;
+        position: relative;
+    }
+    .how-to-title:after {
+        content: '';
+        display: block;
+        width: 80px;
+        height: 4px;
+        background: #2563eb;
+        margin: 0.5rem auto 0;
+        border-radius: 2px;
+    }
+    .step-card {
+        background-color: white;
+        border-radius: 12px;
+        padding: 1.5rem;
+        margin-bottom: 1.5rem;
+        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.05);
+        transition: all 0.3s ease;
+    }
+    .step-card:hover {
+        transform: translateX(5px);
+    }
+    .step-number {
+        font-size: 1.5rem;
+        font-weight: 800;
+        color: #2563eb;
+        margin-bottom: 0.5rem;
+        display: inline-block;
+        background: #e0f2fe;
+        width: 40px;
+        height: 40px;
+        text-align: center;
+        line-height: 40px;
+        border-radius: 50%;
+    }
+    .step-title {
+        font-size: 1.2rem;
+        font-weight: 700;
+        color: #1e293b;
+        margin-bottom: 0.5rem;
+    }
+    .step-desc {
+        color: #475569;
+        line-height: 1.6;
+    }
+    .cta-button {
+        display: inline-block;
+        padding: 1rem 2rem;
+        font-size: 1.2rem;
+        font-weight: 600;
+        text-align: center;
+        border-radius: 12px;
+        background: linear-gradient(to right, #1a3a8f, #2563eb);
+        color: white !important;
+        margin: 2rem auto 0;
+        text-decoration: none;
+        transition: all 0.3s ease;
+        box-shadow: 0 4px 15px rgba(26, 58, 143, 0.3);
+        border: none;
+        cursor: pointer;
+    }
+    .cta-button:hover {
+        background: linear-gradient(to right, #2563eb, #1e40af);
+        transform: translateY(-2px);
+        box-shadow: 0 6px 20px rgba(26, 58, 143, 0.4);
+        color: white;
+    }
+    .styled-divider {
+        border: none;
+        height: 1px;
+        background: linear-gradient(to right, transparent, #cbd5e1, transparent);
+        margin: 3rem 0;
+    }
+</style>
+"""
+
+SIDEBAR_CSS = """
+<style>
+    .sidebar-header {
+        color: #1a3a8f;
+        font-size: 1.5rem;
+        font-weight: 700;
+        margin-bottom: 1rem;
+        text-align: center;
+    }
+    .sidebar-section {
+        padding: 1rem;
+        background-color: #f0f9ff;
+        border-radius: 12px;
+        margin-bottom: 1.5rem;
+    }
+    .sidebar-section-title {
+        font-size: 1.1rem;
+        font-weight: 600;
+        color: #1a3a8f;
+        margin-bottom: 0.5rem;
+    }
+</style>
+"""
+
+@st.cache_resource
+def configure_seaborn():
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    plt.style.use('default')
+    sns.set_theme(style="whitegrid")
+    sns.set_palette(["#1a3a8f", "#1e4ed8", "#2563eb", "#3b82f6", "#93c5fd"])
+
+@st.cache_resource
+def render_pool():
+    return ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4), thread_name_prefix='render')
+
+def read_arrow_csv(uploaded_file, column_types=None):
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    
+    table = pa_csv.read_csv(
+        uploaded_file,
+        read_options=pa_csv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE),
+        convert_options=pa_csv.ConvertOptions(
+            strings_can_be_null=True,
+            null_values=CSV_NA_VALUES,
+            column_types=column_types
+        )
+    )
+    names = table.column_names
+    if '' in names or len(set(names)) != len(names):
+        raise ValueError("Cabeçalho com colunas vazias ou repetidas")
+    temporal = {field.name: pa.string() for field in table.schema if pa.types.is_temporal(field.type)}
+    if temporal and column_types is None:
+        uploaded_file.seek(0)
+        return read_arrow_csv(uploaded_file, temporal)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+def read_uploaded_file(uploaded_file):
+    if uploaded_file.name.endswith('.csv'):
+        try:
+            return read_arrow_csv(uploaded_file)
+        except Exception:
+            uploaded_file.seek(0)
+            return pd.read_csv(uploaded_file)
+    elif uploaded_file.name.endswith(('.xlsx', '.xls')):
+        try:
+            return pd.read_excel(uploaded_file, engine='calamine')
+        except Exception:
+            uploaded_file.seek(0)
+            return pd.read_excel(uploaded_file)
+
+def downcast_numbers(df):
+    for col in df.select_dtypes(include=np.integer).columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in df.select_dtypes(include=np.float64).columns:
+        values = df[col].to_numpy()
+        downcast = values.astype(np.float32)
+        if np.array_equal(downcast.astype(np.float64), values, equal_nan=True):
+            df[col] = downcast
+    return df
+
+def convert_to_categories(df):
+    if len(df) == 0:
+        return df
+    for col in df.select_dtypes(include=['object', 'string']).columns:
+        categorical = df[col].astype('category')
+        if len(categorical.cat.categories) / len(df) < CATEGORY_MAX_UNIQUE_RATIO:
+            df[col] = categorical
+    return df
+
+@st.cache_data(persist="disk" if PERSIST_DATA_CACHE else None, max_entries=16, show_spinner=False)
 def load_data(uploaded_file):
     try:
-        if uploaded_file.name.endswith('.csv'):
-            return pd.read_csv(uploaded_file)
-        elif uploaded_file.name.endswith(('.xlsx', '.xls')):
-            return pd.read_excel(uploaded_file, engine='openpyxl')
+        df = read_uploaded_file(uploaded_file)
+        if df is None:
+            return None
+        return convert_to_categories(downcast_numbers(df))
     except Exception as e:
         st.error(f"Erro ao ler arquivo: {str(e)}")
         return None
 
-def create_pdf_report(df, logo_path, num_images=[], cat_images=[], filename="relatorio.pdf"):
-    pdf = FPDF(orientation='L')
-    pdf.add_page()
-    pdf.set_auto_page_break(auto=True, margin=15)
-    pdf.set_font("Arial", size=10)
-    
-    if logo_path and os.path.exists(logo_path):
-        pdf.image(logo_path, x=10, y=8, w=25)
+def total_nulls(df):
+    if df.size > COLUMNWISE_NULL_SCAN_CELLS:
+        return int(sum(series.isna().sum() for _, series in df.items()))
+    return int(df.isna().to_numpy().sum())
+
+def column_summary(values):
+    values = values[~np.isnan(values)]
+    n = len(values)
+    if n == 0:
+        return [0.0] + [np.nan] * 7
+    positions = np.array([0.25, 0.5, 0.75]) * (n - 1)
+    lower = np.floor(positions).astype(int)
+    upper = np.minimum(lower + 1, n - 1)
+    values = np.partition(values, np.unique(np.concatenate([[0, n - 1], lower, upper])))
+    quartiles = values[lower] + (values[upper] - values[lower]) * (positions - lower)
+    std = values.std(ddof=1) if n > 1 else np.nan
+    return [float(n), values.mean(), std, values[0], *quartiles, values[n - 1]]
+
+def numeric_stats(df, cols):
+    return pd.DataFrame(
+        [column_summary(df[col].to_numpy(dtype=float, na_value=np.nan)) for col in cols],
+        index=cols,
+        columns=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+    )
+
+def classify_columns(df):
+    return (
+        df.select_dtypes(include=np.number).columns.tolist(),
+        df.select_dtypes(include=['object', 'category']).columns.tolist()
+    )
+
+@st.cache_data
+def summarize(df):
+    numerical_cols, categorical_cols = classify_columns(df)
+    return {
+        'n_rows': len(df),
+        'n_cols': len(df.columns),
+        'n_missing': total_nulls(df),
+        'numerical_cols': numerical_cols,
+        'categorical_cols': categorical_cols,
+        'describe': numeric_stats(df, numerical_cols),
+    }
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def value_counts(series, col):
+    return series.value_counts().rename_axis(col)
+
+@st.cache_resource
+def report_styles():
+    from reportlab.lib import colors
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.lib.units import mm
+    from reportlab.platypus import TableStyle
     
-    pdf.set_font("Arial", 'B', 16)
-    pdf.cell(0, 15, "Relatório de Análise de Dados", ln=1, align='C')
-    pdf.ln(5)
+    styles = getSampleStyleSheet()
+    return {
+        'title': ParagraphStyle('ReportTitle', parent=styles['Title'], fontName='Helvetica-Bold', fontSize=16, leading=15 * mm, spaceAfter=0),
+        'info': ParagraphStyle('ReportInfo', parent=styles['Normal'], fontName='Helvetica-Bold', fontSize=10, leading=8 * mm),
+        'section': ParagraphStyle('ReportSection', parent=styles['Heading2'], fontName='Helvetica-Bold', fontSize=14, leading=10 * mm),
+        'subsection': ParagraphStyle('ReportSubsection', parent=styles['Heading3'], fontName='Helvetica-Bold', fontSize=12, leading=8 * mm),
+        'table': TableStyle([
+            ('FONT', (0, 0), (-1, -1), 'Helvetica', 8),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(200 / 255, 220 / 255, 1)),
+        ]),
+    }
+
+def report_document(target):
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.units import mm
+    from reportlab.platypus import SimpleDocTemplate
     
-    pdf.set_font("Arial", 'B', 10)
-    pdf.cell(0, 8, f"Data do relatório: {datetime.now().strftime('%d/%m/%Y %H:%M')}", ln=1)
-    pdf.cell(0, 8, f"Total de registros: {len(df)}", ln=1)
-    pdf.cell(0, 8, f"Total de colunas: {len(df.columns)}", ln=1)
-    pdf.cell(0, 8, f"Total de valores faltantes: {df.isnull().sum().sum()}", ln=1)
-    pdf.ln(10)
+    return SimpleDocTemplate(
+        target,
+        pagesize=landscape(A4),
+        leftMargin=10 * mm, rightMargin=10 * mm,
+        topMargin=10 * mm, bottomMargin=15 * mm
+    )
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def resize_logo(data):
+    from PIL import Image
+    image = Image.open(io.BytesIO(data))
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA')
+    image.thumbnail((LOGO_MAX_PX, LOGO_MAX_PX), Image.LANCZOS)
+    buf = io.BytesIO()
+    image.save(buf, format='PNG', compress_level=PNG_COMPRESS_LEVEL)
+    return buf.getvalue()
+
+def render_summary_pdf(summary, logo, report_date):
+    from reportlab.lib.units import mm
+    from reportlab.lib.utils import ImageReader
+    from reportlab.platypus import Paragraph, Spacer, Table
     
-    pdf.set_font("Arial", 'B', 14)
-    pdf.cell(0, 10, "Resumo Estatístico", ln=1)
-    pdf.set_font("Arial", '', 8)
+    styles = report_styles()
+    story = [
+        Paragraph("Relatório de Análise de Dados", styles['title']),
+        Spacer(1, 5 * mm),
+        Paragraph(f"Data do relatório: {report_date}", styles['info']),
+        Paragraph(f"Total de registros: {summary['n_rows']}", styles['info']),
+        Paragraph(f"Total de colunas: {summary['n_cols']}", styles['info']),
+        Paragraph(f"Total de valores faltantes: {summary['n_missing']}", styles['info']),
+        Spacer(1, 10 * mm),
+        Paragraph("Resumo Estatístico", styles['section']),
+    ]
     
-    desc_stats = df.describe().T.reset_index()
+    desc_stats = summary['describe'].reset_index()
     desc_stats.columns = ['Coluna', 'Contagem', 'Média', 'Desvio Padrão', 'Mínimo', '25%', '50%', '75%', 'Máximo']
     
-    page_width = 280
+    page_width = 280 * mm
     col_widths = [
         page_width * 0.15, page_width * 0.10, page_width * 0.10,
         page_width * 0.12, page_width * 0.10, page_width * 0.10,
         page_width * 0.10, page_width * 0.10, page_width * 0.10
     ]
     
-    headers = desc_stats.columns.tolist()
-    pdf.set_fill_color(200, 220, 255)
-    for i, header in enumerate(headers):
-        pdf.cell(col_widths[i], 8, header, border=1, fill=True, align='C')
-    pdf.ln()
-    
-    pdf.set_fill_color(255, 255, 255)
-    for _, row in desc_stats.iterrows():
-        for i, col in enumerate(headers):
-            value = row[col]
-            if isinstance(value, float):
-                value = f"{value:.2f}"
-            pdf.cell(col_widths[i], 8, str(value), border=1, align='C')
-        pdf.ln()
-    
-    pdf.ln(10)
-    
-    if num_images or cat_images:
-        pdf.add_page(orientation='L')
-        pdf.set_font("Arial", 'B', 14)
-        pdf.cell(0, 10, "Visualizações Gráficas", ln=1)
-        pdf.ln(8)
-        
-        if num_images:
-            pdf.set_font("Arial", 'B', 12)
-            pdf.cell(0, 8, "Análise Numérica", ln=1)
-            pdf.ln(5)
-            for img_path in num_images:
-                if os.path.exists(img_path):
-                    img_width = 260
-                    x_position = (pdf.w - img_width) / 2
-                    pdf.image(img_path, x=x_position, w=img_width)
-                    pdf.ln(5)
-        
-        if cat_images:
-            pdf.set_font("Arial", 'B', 12)
-            pdf.cell(0, 8, "Análise Categórica", ln=1)
-            pdf.ln(5)
-            for img_path in cat_images:
-                if os.path.exists(img_path):
-                    img_width = 260
-                    x_position = (pdf.w - img_width) / 2
-                    pdf.image(img_path, x=x_position, w=img_width)
-                    pdf.ln(5)
-    
-    pdf.output(filename)
-    return filename
-
-def save_plot(fig):
-    with NamedTemporaryFile(delete=False, suffix='.png') as tmpfile:
-        fig.savefig(tmpfile.name, bbox_inches='tight', dpi=150)
-        return tmpfile.name
+    names = desc_stats['Coluna'].astype(str).to_numpy()[:, None]
+    values = np.char.mod('%.2f', desc_stats.iloc[:, 1:].to_numpy(dtype=float))
+    rows = np.hstack([names, values]).tolist()
+    story.append(Table(
+        [desc_stats.columns.tolist()] + rows,
+        colWidths=col_widths, rowHeights=[5.5 * mm] * (len(rows) + 1),
+        repeatRows=1, style=styles['table']
+    ))
+    
+    def draw_logo(canvas, doc):
+        if logo:
+            canvas.drawImage(
+                ImageReader(io.BytesIO(logo)), 10 * mm, doc.pagesize[1] - 33 * mm,
+                width=25 * mm, height=25 * mm,
+                preserveAspectRatio=True, anchor='nw', mask='auto'
+            )
+    
+    buf = io.BytesIO()
+    report_document(buf).build(story, onFirstPage=draw_logo)
+    buf.seek(0)
+    return buf
+
+def render_image_page(img, headings):
+    from reportlab.lib.units import mm
+    from reportlab.platypus import Image, Paragraph, Spacer
+    
+    styles = report_styles()
+    story = []
+    for text, style, space_after in headings:
+        story += [Paragraph(text, styles[style]), Spacer(1, space_after * mm)]
+    story.append(Image(io.BytesIO(img), width=260 * mm, height=150 * mm, kind='proportional'))
+    
+    buf = io.BytesIO()
+    report_document(buf).build(story)
+    buf.seek(0)
+    return buf
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def create_pdf_report(summary, logo, report_date, num_images=[], cat_images=[]):
+    import pikepdf
+    
+    pages = []
+    for section, images in (("Análise Numérica", num_images), ("Análise Categórica", cat_images)):
+        for i, img in enumerate(images):
+            headings = []
+            if not pages:
+                headings.append(("Visualizações Gráficas", 'section', 8))
+            if i == 0:
+                headings.append((section, 'subsection', 5))
+            pages.append((img, headings))
+    
+    page_pdfs = render_pool().map(lambda page: render_image_page(*page), pages)
+    summary_pdf = render_summary_pdf(summary, logo, report_date)
+    sources = [pikepdf.open(pdf) for pdf in [summary_pdf, *page_pdfs]]
+    
+    try:
+        report = sources[0]
+        for source in sources[1:]:
+            report.pages.extend(source.pages)
+        buf = io.BytesIO()
+        report.save(buf)
+    finally:
+        for source in sources:
+            source.close()
+    return buf.getvalue()
+
+def sample_column(series, max_rows):
+    data = series.dropna()
+    if len(data) > max_rows:
+        data = data.sample(max_rows, random_state=0)
+    return data
+
+def reusable_axes(kind, figsize):
+    figures = getattr(_thread_figures, 'axes', None)
+    if figures is None:
+        figures = _thread_figures.axes = {}
+    if kind not in figures:
+        from matplotlib.figure import Figure
+        figures[kind] = Figure(figsize=figsize).subplots()
+    ax = figures[kind]
+    ax.clear()
+    return ax.figure, ax
+
+def kde_curve(values, points=200):
+    bandwidth = values.std(ddof=1) * len(values) ** (-1 / 5) if len(values) > 1 else 0
+    if not bandwidth > 0:
+        return None, None
+    binned, edges = np.histogram(values, bins=points)
+    centers = (edges[:-1] + edges[1:]) / 2
+    grid = np.linspace(values.min(), values.max(), points)
+    kernel = np.exp(-0.5 * ((grid[:, None] - centers[None, :]) / bandwidth) ** 2)
+    density = kernel @ binned / (len(values) * bandwidth * np.sqrt(2 * np.pi))
+    return grid, density
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def render_histogram(series, col, show_kde=False):
+    values = sample_column(series, HIST_SAMPLE_SIZE).to_numpy(dtype=float)
+    values = values[np.isfinite(values)]
+    fig, ax = reusable_axes('hist', (8, 4))
+    if len(values):
+        counts, edges = np.histogram(values, bins='auto')
+        ax.stairs(counts, edges, fill=True, color='#1a3a8f', alpha=0.5)
+        ax.vlines(edges[1:-1], 0, np.minimum(counts[:-1], counts[1:]), colors='white', linewidth=0.5)
+        grid, density = kde_curve(values) if show_kde else (None, None)
+        if grid is not None:
+            ax.plot(grid, density * len(values) * (edges[1] - edges[0]), color='#1a3a8f', linewidth=1.5)
+    ax.set_xlabel(col)
+    ax.set_ylabel('Count')
+    return save_plot(fig)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def render_boxplot(series, col, stats):
+    data = sample_column(series, BOXPLOT_SAMPLE_SIZE)
+    fig, ax = reusable_axes('box', (8, 4))
+    if not data.empty:
+        q1, med, q3 = stats['25%'], stats['50%'], stats['75%']
+        low, high = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+        inside = (data >= low) & (data <= high)
+        box = dict(
+            med=med, q1=q1, q3=q3,
+            whislo=data[inside].min(), whishi=data[inside].max(),
+            fliers=data[~inside].to_numpy()
+        )
+        ax.bxp(
+            [box], orientation='horizontal', widths=0.6, patch_artist=True,
+            boxprops=dict(facecolor='#1e4ed8', edgecolor='#3f3f3f'),
+            medianprops=dict(color='#3f3f3f'),
+            whiskerprops=dict(color='#3f3f3f'),
+            capprops=dict(color='#3f3f3f'),
+            flierprops=dict(marker='d', markerfacecolor='#3f3f3f', markeredgecolor='#3f3f3f', markersize=5)
+        )
+        ax.set_yticks([])
+    ax.set_xlabel(col)
+    return save_plot(fig, quantize=True)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def render_top_values(counts, col, top_n):
+    import seaborn as sns
+    fig, ax = reusable_axes('bar', (10, 5))
+    sns.barplot(x=counts.values, y=counts.index.astype(str), ax=ax, palette='Blues_d')
+    ax.set_ylabel(col)
+    ax.set_title(f'Top {top_n} Valores em {col}')
+    return save_plot(fig, quantize=True)
+
+def save_plot(fig, quantize=False):
+    buf = io.BytesIO()
+    compress_level = 0 if quantize else PNG_COMPRESS_LEVEL
+    fig.savefig(buf, format='png', bbox_inches='tight', dpi=100, pil_kwargs={'compress_level': compress_level})
+    if quantize:
+        from PIL import Image
+        buf.seek(0)
+        image = Image.open(buf).convert('RGB').quantize(256, dither=Image.Dither.NONE)
+        buf = io.BytesIO()
+        image.save(buf, format='PNG', compress_level=PNG_COMPRESS_LEVEL)
+    return buf.getvalue()
 
 def show_homepage():
-    st.markdown("""
-    <style>
-        .stApp { background-color: #f8fafc; }
-        .hero-section {
-            background: linear-gradient(135deg, #1a3a8f 0%, #2563eb 100%);
-            border-radius: 16px;
-            padding: 4rem 2rem;
-            margin: -1rem -1rem 3rem -1rem;
-            text-align: center;
-            color: white;
-            box-shadow: 0 4px 20px rgba(0, 0, 0, 0.1);
-        }
-        .title-text {
-            font-size: 3.5rem !important;
-            font-weight: 800 !important;
-            color: white !important;
-            margin-bottom: 1rem;
-            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-        }
-        .subtitle-text {
-            font-size: 1.5rem !important;
-            color: rgba(255, 255, 255, 0.9) !important;
-            margin-bottom: 2rem;
-            font-weight: 400;
-        }
-        .feature-card {
-            border-radius: 12px;
-            padding: 2rem 1.5rem;
-            background-color: white;
-            box-shadow: 0 4px 20px rgba(0, 0, 0, 0.05);
-            transition: all 0.3s ease;
-            height: 100%;
-            border: 1px solid #e2e8f0;
-        }
-        .feature-card:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 10px 25px rgba(0, 0, 0, 0.1);
-            border-color: #93c5fd;
-        }
-        .feature-icon {
-            font-size: 2.5rem;
-            margin-bottom: 1.5rem;
-            color: #1a3a8f;
-            background: #e0f2fe;
-            width: 70px;
-            height: 70px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            border-radius: 50%;
-            margin-left: auto;
-            margin-right: auto;
-        }
-        .feature-title {
-            font-size: 1.3rem;
-            font-weight: 700;
-            margin-bottom: 1rem;
-            color: #1e293b;
-            text-align: center;
-        }
-        .feature-desc {
-            color: #64748b;
-            font-size: 1rem;
-            text-align: center;
-            line-height: 1.6;
-        }
-        .how-to-container {
-            background-color: white;
-            border-radius: 16px;
-            padding: 3rem;
-            margin-top: 3rem;
-            box-shadow: 0 4px 20px rgba(0, 0, 0, 0.05);
-            border: 1px solid #e2e8f0;
-        }
-        .how-to-title {
-            font-size: 2rem;
-            font-weight: 700;
-            color: #1e293b;
-            text-align: center;
-            margin-bottom: 2rem;
-            position: relative;
-        }
-        .how-to-title:after {
-            content: '';
-            display: block;
-            width: 80px;
-            height: 4px;
-            background: #2563eb;
-            margin: 0.5rem auto 0;
-            border-radius: 2px;
-        }
-        .step-card {
-            background-color: white;
-            border-radius: 12px;
-            padding: 1.5rem;
-            margin-bottom: 1.5rem;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.05);
-            transition: all 0.3s ease;
-        }
-        .step-card:hover {
-            transform: translateX(5px);
-        }
-        .step-number {
-            font-size: 1.5rem;
-            font-weight: 800;
-            color: #2563eb;
-            margin-bottom: 0.5rem;
-            display: inline-block;
-            background: #e0f2fe;
-            width: 40px;
-            height: 40px;
-            text-align: center;
-            line-height: 40px;
-            border-radius: 50%;
-        }
-        .step-title {
-            font-size: 1.2rem;
-            font-weight: 700;
-            color: #1e293b;
-            margin-bottom: 0.5rem;
-        }
-        .step-desc {
-            color: #475569;
-            line-height: 1.6;
-        }
-        .cta-button {
-            display: inline-block;
-            padding: 1rem 2rem;
-            font-size: 1.2rem;
-            font-weight: 600;
-            text-align: center;
-            border-radius: 12px;
-            background: linear-gradient(to right, #1a3a8f, #2563eb);
-            color: white !important;
-            margin: 2rem auto 0;
-            text-decoration: none;
-            transition: all 0.3s ease;
-            box-shadow: 0 4px 15px rgba(26, 58, 143, 0.3);
-            border: none;
-            cursor: pointer;
-        }
-        .cta-button:hover {
-            background: linear-gradient(to right, #2563eb, #1e40af);
-            transform: translateY(-2px);
-            box-shadow: 0 6px 20px rgba(26, 58, 143, 0.4);
-            color: white;
-        }
-        .styled-divider {
-            border: none;
-            height: 1px;
-            background: linear-gradient(to right, transparent, #cbd5e1, transparent);
-            margin: 3rem 0;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(HOMEPAGE_CSS, unsafe_allow_html=True)
     
     st.markdown("""
     <div class="hero-section">
@@ -392,30 +673,62 @@ def show_homepage():
     </div>
     """, unsafe_allow_html=True)
 
+@st.fragment
+def numerical_analysis(df, numerical_cols, num_stats, num_images):
+    configure_seaborn()
+    st.header("📈 Análise Numérica")
+    
+    selected_num_cols = st.multiselect(
+        "Selecione colunas numéricas para análise", 
+        numerical_cols,
+        help="Selecione várias colunas para análise"
+    )
+    
+    show_kde = st.checkbox("Mostrar curva de densidade (KDE)", value=False)
+    
+    executor = render_pool()
+    hist_images = executor.map(lambda col: render_histogram(df[col], col, show_kde), selected_num_cols)
+    box_images = executor.map(lambda col: render_boxplot(df[col], col, num_stats.loc[col]), selected_num_cols)
+    rendered = list(zip(selected_num_cols, hist_images, box_images))
+    
+    for col, hist_png, box_png in rendered:
+        with st.expander(f"Análise da coluna: **{col}**", expanded=True):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader(f"Distribuição de {col}")
+                st.image(hist_png)
+                num_images.append(hist_png)
+            
+            with col2:
+                st.subheader(f"Boxplot de {col}")
+                st.image(box_png)
+                num_images.append(box_png)
+
+@st.fragment
+def categorical_analysis(df, categorical_cols, cat_images):
+    configure_seaborn()
+    st.header("📊 Análise Categórica")
+    
+    selected_cat_cols = st.multiselect(
+        "Selecione colunas categóricas para análise", 
+        categorical_cols,
+        help="Selecione várias colunas para análise"
+    )
+    
+    top_n = st.slider("Mostrar top N valores", 5, 20, 10)
+    
+    top_counts = [value_counts(df[col], col).head(top_n) for col in selected_cat_cols]
+    bar_images = render_pool().map(lambda counts, col: render_top_values(counts, col, top_n), top_counts, selected_cat_cols)
+    rendered = list(zip(selected_cat_cols, bar_images))
+    
+    for col, bar_png in rendered:
+        with st.expander(f"Análise da coluna: **{col}**", expanded=True):
+            st.image(bar_png)
+            cat_images.append(bar_png)
+
 with st.sidebar:
-    st.markdown("""
-    <style>
-        .sidebar-header {
-            color: #1a3a8f;
-            font-size: 1.5rem;
-            font-weight: 700;
-            margin-bottom: 1rem;
-            text-align: center;
-        }
-        .sidebar-section {
-            padding: 1rem;
-            background-color: #f0f9ff;
-            border-radius: 12px;
-            margin-bottom: 1.5rem;
-        }
-        .sidebar-section-title {
-            font-size: 1.1rem;
-            font-weight: 600;
-            color: #1a3a8f;
-            margin-bottom: 0.5rem;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(SIDEBAR_CSS, unsafe_allow_html=True)
     
     st.markdown('<div class="sidebar-header">Report Lab</div>', unsafe_allow_html=True)
     st.markdown("<hr>", unsafe_allow_html=True)
@@ -452,123 +765,69 @@ if df is None:
 st.session_state['df'] = df
 st.success(f"✅ Arquivo '{uploaded_file.name}' carregado com sucesso!")
 
-logo_path = None
+logo = None
 if logo_file:
-    with NamedTemporaryFile(delete=False, suffix='.png') as tmp_file:
-        tmp_file.write(logo_file.getvalue())
-        logo_path = tmp_file.name
-    st.success(f"✅ Logo carregada com sucesso!")
+    try:
+        logo = resize_logo(logo_file.getvalue())
+        st.success(f"✅ Logo carregada com sucesso!")
+    except Exception as e:
+        st.error(f"❌ Não foi possível ler a logo, o relatório será gerado sem ela: {str(e)}")
 
 st.header("Visão Geral dos Dados")
+summary = summarize(df)
 col1, col2, col3 = st.columns(3)
 with col1:
-    st.metric("Total de Registros", len(df))
+    st.metric("Total de Registros", summary['n_rows'])
 with col2:
-    st.metric("Total de Colunas", len(df.columns))
+    st.metric("Total de Colunas", summary['n_cols'])
 with col3:
-    st.metric("Valores Faltantes", df.isnull().sum().sum())
+    st.metric("Valores Faltantes", summary['n_missing'])
 
 st.subheader("Amostra dos Dados")
 st.dataframe(df.head(), height=250, use_container_width=True)
 
-num_figs, cat_figs = [], []
-num_image_paths, cat_image_paths = [], []
+num_images, cat_images = [], []
 
-numerical_cols = df.select_dtypes(include=np.number).columns.tolist()
-if numerical_cols:
-    st.header("📈 Análise Numérica")
-    
-    selected_num_cols = st.multiselect(
-        "Selecione colunas numéricas para análise", 
-        numerical_cols,
-        help="Selecione várias colunas para análise"
-    )
-    
-    for col in selected_num_cols:
-        with st.expander(f"Análise da coluna: **{col}**", expanded=True):
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader(f"Distribuição de {col}")
-                fig1, ax1 = plt.subplots(figsize=(8, 4))
-                sns.histplot(df[col], kde=True, color='#1a3a8f')
-                st.pyplot(fig1)
-                num_figs.append(fig1)
-                plt.close(fig1)
-            
-            with col2:
-                st.subheader(f"Boxplot de {col}")
-                fig2, ax2 = plt.subplots(figsize=(8, 4))
-                sns.boxplot(x=df[col], color='#1e4ed8')
-                st.pyplot(fig2)
-                num_figs.append(fig2)
-                plt.close(fig2)
-
-categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
-if categorical_cols:
-    st.header("📊 Análise Categórica")
-    
-    selected_cat_cols = st.multiselect(
-        "Selecione colunas categóricas para análise", 
-        categorical_cols,
-        help="Selecione várias colunas para análise"
-    )
-    
-    top_n = st.slider("Mostrar top N valores", 5, 20, 10)
-    
-    for col in selected_cat_cols:
-        with st.expander(f"Análise da coluna: **{col}**", expanded=True):
-            counts = df[col].value_counts().nlargest(top_n)
-            
-            fig, ax = plt.subplots(figsize=(10, 5))
-            sns.barplot(x=counts.values, y=counts.index, ax=ax, palette='Blues_d')
-            plt.title(f'Top {top_n} Valores em {col}')
-            st.pyplot(fig)
-            cat_figs.append(fig)
-            plt.close(fig)
+if summary['numerical_cols']:
+    numerical_analysis(df, summary['numerical_cols'], summary['describe'], num_images)
+
+if summary['categorical_cols']:
+    categorical_analysis(df, summary['categorical_cols'], cat_images)
 
 st.markdown("---")
 st.header("📤 Exportar Relatório")
 
 if st.button("Gerar Relatório em PDF", use_container_width=True, type="primary"):
-    if not num_figs and not cat_figs:
+    if not num_images and not cat_images:
         st.warning("⚠️ Selecione pelo menos uma coluna para análise antes de gerar o relatório!")
-    else:
-        with st.spinner("Criando relatório profissional..."):
-            try:
-                num_image_paths = [save_plot(fig) for fig in num_figs] if num_figs else []
-                cat_image_paths = [save_plot(fig) for fig in cat_figs] if cat_figs else []
-                
-                report_path = os.path.abspath("relatorio_analise.pdf")
-                
-                create_pdf_report(
-                    df, 
-                    logo_path, 
-                    num_image_paths, 
-                    cat_image_paths,
-                    filename=report_path
-                )
-                
-                if os.path.exists(report_path):
-                    st.success("✅ Relatório gerado com sucesso!")
-                    
-                    with open(report_path, "rb") as f:
-                        st.download_button(
-                            "Baixar Relatório PDF",
-                            data=f,
-                            file_name=os.path.basename(report_path),
-                            mime="application/octet-stream"
-                        )
-                else:
-                    st.error("Falha ao gerar o relatório PDF")
-                
-            except Exception as e:
-                st.error(f"Erro ao gerar relatório: {str(e)}")
-                st.text(traceback.format_exc())
-            finally:
-                all_temp_files = []
-                if logo_path:
-                    all_temp_files.append(logo_path)
-                all_temp_files.extend(num_image_paths)
-                all_temp_files.extend(cat_image_paths)
-                cleanup_temp_files(*all_temp_files)
+        st.stop()
+    pdf_bytes = None
+    with st.status("Criando relatório profissional...", expanded=True) as status:
+        try:
+            status.write(f"📊 {len(num_images)} gráficos numéricos e {len(cat_images)} categóricos prontos")
+            status.write("📄 Montando páginas do PDF...")
+            pdf_bytes = create_pdf_report(
+                summary, 
+                logo, 
+                datetime.now().strftime('%d/%m/%Y %H:%M'),
+                num_images, 
+                cat_images
+            )
+            
+            if pdf_bytes:
+                status.update(label="✅ Relatório gerado com sucesso!", state="complete", expanded=False)
+            else:
+                status.update(label="Falha ao gerar o relatório PDF", state="error")
+            
+        except Exception as e:
+            status.update(label="Erro ao gerar relatório", state="error")
+            st.error(f"Erro ao gerar relatório: {str(e)}")
+            logging.exception("Erro ao gerar relatório")
+    
+    if pdf_bytes:
+        st.download_button(
+            "Baixar Relatório PDF",
+            data=pdf_bytes,
+            file_name="relatorio_analise.pdf",
+            mime="application/pdf"
+        )